@@ -729,6 +729,12 @@ class GapiManager {
 
   public static bigquery = class {
 
+    // The inline details pane and the preview page often ask for the same
+    // table at the same time. Concurrent callers share the pending request,
+    // which is dropped once it settles so that later calls see fresh data.
+    private static _pendingTableDetails =
+        new Map<string, Promise<gapi.client.HttpRequestFulfilled<gapi.client.bigquery.Table>>>();
+
     /**
      * Gets the list of BigQuery projects, returns a Promise.
      */
@@ -777,17 +783,32 @@ class GapiManager {
     }
 
     /**
-     * Fetches table details from BigQuery
+     * Fetches table details from BigQuery. Concurrent requests for the same
+     * table share a single call.
      */
     public static getTableDetails(projectId: string, datasetId: string, tableId: string):
         Promise<gapi.client.HttpRequestFulfilled<gapi.client.bigquery.Table>> {
+      const key = projectId + ':' + datasetId + '.' + tableId;
+      const pending = this._pendingTableDetails.get(key);
+      if (pending) {
+        return pending;
+      }
+
       const request = {
         datasetId,
         projectId,
         tableId,
       };
-      return this._load()
+      const promise = this._load()
         .then(() => gapi.client.bigquery.tables.get(request));
+      this._pendingTableDetails.set(key, promise);
+      const forget = () => {
+        if (this._pendingTableDetails.get(key) === promise) {
+          this._pendingTableDetails.delete(key);
+        }
+      };
+      promise.then(forget, forget);
+      return promise;
     }
 
     /**
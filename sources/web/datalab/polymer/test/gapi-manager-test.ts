@@ -0,0 +1,112 @@
+/*
+ * Copyright 2017 Google Inc. All rights reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+ * in compliance with the License. You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software distributed under the License
+ * is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+ * or implied. See the License for the specific language governing permissions and limitations under
+ * the License.
+ */
+
+interface PendingTablesGet {
+  request: any;
+  resolve: (value: any) => void;
+  reject: (reason: any) => void;
+}
+
+describe('GapiManager', () => {
+
+  describe('bigquery.getTableDetails', () => {
+    const originalGapi = (window as any).gapi;
+    const originalLoad = GapiManager.auth.loadGapiAndScopes;
+
+    // Each call to tables.get returns a promise that the test settles by hand.
+    let requests: PendingTablesGet[];
+
+    beforeEach(() => {
+      requests = [];
+      GapiManager.auth.loadGapiAndScopes = () => Promise.resolve();
+      (window as any).gapi = {
+        client: {
+          bigquery: {
+            tables: {
+              get: (request: any) => new Promise((resolve, reject) => {
+                requests.push({request, resolve, reject});
+              }),
+            },
+          },
+        },
+      };
+    });
+
+    afterEach(() => {
+      GapiManager.auth.loadGapiAndScopes = originalLoad;
+      (window as any).gapi = originalGapi;
+    });
+
+    // Lets the chained _load().then(...) call reach tables.get.
+    const flush = () => new Promise((resolve) => setTimeout(resolve));
+
+    it('shares a pending request between concurrent callers', async () => {
+      const first = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid');
+      const second = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid');
+      assert(first === second, 'concurrent callers should get the same promise');
+
+      await flush();
+      assert(requests.length === 1, 'only one request should be sent');
+      assert(requests[0].request.projectId === 'pid' &&
+             requests[0].request.datasetId === 'did' &&
+             requests[0].request.tableId === 'tid',
+          'request should name the table');
+
+      requests[0].resolve({result: {id: 'pid:did.tid'}});
+      const response = await second;
+      assert(response.result.id === 'pid:did.tid', 'both callers should get the response');
+    });
+
+    it('does not share requests between different tables', async () => {
+      const first = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid1');
+      const second = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid2');
+      assert(first !== second, 'different tables should get different promises');
+
+      await flush();
+      assert(requests.length === 2, 'one request per table should be sent');
+      requests.forEach((r) => r.resolve({result: {}}));
+      await Promise.all([first, second]);
+    });
+
+    it('sends a new request once the previous one has resolved', async () => {
+      const first = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid');
+      await flush();
+      requests[0].resolve({result: {numRows: '1'}});
+      await first;
+      await flush();
+
+      const second = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid');
+      assert(first !== second, 'a settled request should not be reused');
+      await flush();
+      assert(requests.length === 2, 'a fresh request should be sent');
+      requests[1].resolve({result: {numRows: '2'}});
+      const response = await second;
+      assert(response.result.numRows === '2', 'caller should get the fresh response');
+    });
+
+    it('retries after a failed request', async () => {
+      const first = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid');
+      await flush();
+      requests[0].reject({body: 'failed'});
+      await first.then(() => assert(false, 'should have failed'), () => undefined);
+      await flush();
+
+      const second = GapiManager.bigquery.getTableDetails('pid', 'did', 'tid');
+      await flush();
+      assert(requests.length === 2, 'a failed request should not be reused');
+      requests[1].resolve({result: {}});
+      await second;
+    });
+  });
+});